@@ -0,0 +1,117 @@
+class BeladyScanner:
+    """
+    Simula o FIFO para vários tamanhos de memória física em uma única
+    passada pela lista de acessos, procurando a anomalia de Belady
+    (mais molduras gerando mais falhas de página).
+    """
+
+    def __init__(self, num_pages, min_frames, max_frames):
+        """
+        Inicializa o scanner com o intervalo de molduras a ser analisado.
+
+        Args:
+            num_pages (int): Número de páginas na memória virtual.
+            min_frames (int): Menor número de molduras simulado.
+            max_frames (int): Maior número de molduras simulado.
+        """
+        if min_frames < 1 or max_frames < min_frames:
+            raise ValueError(
+                f"Intervalo de molduras inválido: {min_frames}..{max_frames}"
+            )
+
+        self.num_pages = num_pages
+        self.frame_counts = list(range(min_frames, max_frames + 1))
+
+    def decode(self, virtual_access_list):
+        """
+        Converte a lista de acessos em números de página uma única vez,
+        descartando endereços inválidos (mesmo critério do Simulator).
+        """
+        pages = []
+        for virtual_address in virtual_access_list:
+            try:
+                page_number = int(virtual_address)
+            except ValueError:
+                continue
+            if 0 <= page_number < self.num_pages:
+                pages.append(page_number)
+        return pages
+
+    def count_faults(self, virtual_access_list):
+        """
+        Conta as falhas de página do FIFO para cada número de molduras.
+
+        Cada tamanho guarda apenas quantas páginas já carregou e, por página,
+        o número de ordem da sua última carga: no FIFO com k molduras a página
+        está presente se estiver entre as últimas k cargas. Assim todos os
+        tamanhos são atualizados no mesmo laço, sem filas nem tabelas.
+
+        Retorna:
+            dict: {num_frames: total_page_faults}
+        """
+        pages = self.decode(virtual_access_list)
+
+        # Com mais molduras que páginas distintas só há falhas compulsórias
+        distinct = len(set(pages))
+        sizes = [k for k in self.frame_counts if k < distinct]
+
+        loads = [0] * len(sizes)
+        # Marca inicial que nunca conta como presente em nenhum tamanho
+        never_loaded = -(self.frame_counts[-1] + 1)
+        loaded_at = {}
+
+        for page_number in pages:
+            stamps = loaded_at.get(page_number)
+            if stamps is None:
+                stamps = [never_loaded] * len(sizes)
+                loaded_at[page_number] = stamps
+
+            for i, k in enumerate(sizes):
+                if loads[i] - stamps[i] > k:  # FAULT
+                    stamps[i] = loads[i]
+                    loads[i] += 1
+
+        faults = dict(zip(sizes, loads))
+        for k in self.frame_counts:
+            if k >= distinct:
+                faults[k] = distinct
+        return faults
+
+    def find_anomalies(self, faults):
+        """
+        Encontra os intervalos de molduras em que aumentar a memória
+        aumenta as falhas. Passos consecutivos de piora são agrupados
+        em um único intervalo.
+
+        Retorna:
+            list: Lista de dicts com 'from_frames', 'to_frames',
+                  'faults_from' e 'faults_to'.
+        """
+        anomalies = []
+        for k in self.frame_counts[:-1]:
+            if faults[k + 1] <= faults[k]:
+                continue
+            if anomalies and anomalies[-1]["to_frames"] == k:
+                anomalies[-1]["to_frames"] = k + 1
+                anomalies[-1]["faults_to"] = faults[k + 1]
+            else:
+                anomalies.append({
+                    "from_frames": k,
+                    "to_frames": k + 1,
+                    "faults_from": faults[k],
+                    "faults_to": faults[k + 1]
+                })
+        return anomalies
+
+    def scan(self, virtual_access_list):
+        """
+        Executa a varredura completa e empacota o resultado.
+
+        Retorna:
+            dict: Falhas por número de molduras e intervalos anômalos.
+        """
+        faults = self.count_faults(virtual_access_list)
+        return {
+            "faults_by_frames": faults,
+            "anomalies": self.find_anomalies(faults)
+        }
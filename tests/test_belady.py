@@ -0,0 +1,76 @@
+import sys
+import os
+import unittest
+from collections import deque
+
+# Adiciona o diretório raiz do projeto ao PYTHONPATH
+current_dir = os.path.dirname(__file__)
+project_dir = os.path.abspath(os.path.join(current_dir, '..'))
+sys.path.insert(0, project_dir)
+
+from src.belady import BeladyScanner
+
+class TestBeladyScanner(unittest.TestCase):
+    """
+    Testa a varredura do FIFO para vários números de molduras
+    e a detecção da anomalia de Belady.
+    """
+
+    def fifo_faults(self, pages, num_frames):
+        """
+        FIFO de referência (uma simulação por tamanho) para comparação.
+        """
+        queue = deque()
+        faults = 0
+        for page in pages:
+            if page not in queue:
+                faults += 1
+                if len(queue) == num_frames:
+                    queue.popleft()
+                queue.append(page)
+        return faults
+
+    def test_01_classic_belady_sequence(self):
+        """
+        Sequência clássica: 0 1 2 3 0 1 4 0 1 2 3 4
+        Com 3 molduras há 9 falhas e com 4 molduras há 10.
+        """
+        access_list = "0 1 2 3 0 1 4 0 1 2 3 4".split()
+        scanner = BeladyScanner(num_pages=8, min_frames=1, max_frames=6)
+
+        report = scanner.scan(access_list)
+
+        self.assertEqual(report['faults_by_frames'][3], 9)
+        self.assertEqual(report['faults_by_frames'][4], 10)
+        self.assertListEqual(report['anomalies'], [{
+            "from_frames": 3,
+            "to_frames": 4,
+            "faults_from": 9,
+            "faults_to": 10
+        }])
+
+    def test_02_matches_single_size_fifo(self):
+        """
+        Compara a passada única com um FIFO simulado tamanho a tamanho,
+        ignorando endereços inválidos como o Simulator.
+        """
+        access_list = "7 0 1 2 0 3 x 0 4 2 3 0 3 2 1 2 0 1 7 0 1 9".split()
+        pages = [7, 0, 1, 2, 0, 3, 0, 4, 2, 3, 0, 3, 2, 1, 2, 0, 1, 7, 0, 1]
+        scanner = BeladyScanner(num_pages=8, min_frames=1, max_frames=10)
+
+        faults = scanner.count_faults(access_list)
+
+        for num_frames in range(1, 11):
+            self.assertEqual(faults[num_frames], self.fifo_faults(pages, num_frames))
+
+    def test_03_invalid_frame_range(self):
+        """
+        Intervalos de molduras vazios ou com zero molduras são rejeitados.
+        """
+        with self.assertRaises(ValueError):
+            BeladyScanner(num_pages=8, min_frames=0, max_frames=4)
+        with self.assertRaises(ValueError):
+            BeladyScanner(num_pages=8, min_frames=5, max_frames=4)
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)